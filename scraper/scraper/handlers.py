@@ -0,0 +1,43 @@
+# Define here the download handlers for your project
+#
+# See documentation in:
+# https://docs.scrapy.org/en/latest/topics/settings.html#download-handlers
+
+from scrapy_playwright.handler import ScrapyPlaywrightDownloadHandler
+
+
+class PlaywrightPageReuseHandler(ScrapyPlaywrightDownloadHandler):
+    # Picks the browser context for each Playwright request
+    # (spider.next_context, from the request's context_kind), then hands it a
+    # page the spider has finished with in that context (spider.idle_pages),
+    # so it navigates an already-open tab instead of opening a new page for
+    # every request.
+    #
+    # This is done here rather than in a downloader middleware because the
+    # handler only runs once the request has a free download slot; middleware
+    # runs before the request waits in the slot queue, so queued requests
+    # would hold on to idle pages and context names while only a few run.
+
+    async def download_request(self, request):
+        if request.meta.get("playwright"):
+            self._assign_page(request)
+        return await super().download_request(request)
+
+    def _assign_page(self, request):
+        meta = request.meta
+        spider = self._crawler.spider
+
+        if "playwright_context" not in meta and hasattr(spider, "next_context"):
+            meta["playwright_context"] = spider.next_context(meta.get("context_kind", "default"))
+
+        # Retried requests keep the page of the failed attempt; drop it if dead
+        page = meta.get("playwright_page")
+        if page is not None:
+            if page.is_closed():
+                del meta["playwright_page"]
+            else:
+                return
+
+        idle = getattr(spider, "idle_pages", {}).get(meta.get("playwright_context"))
+        if idle:
+            meta["playwright_page"] = idle.pop()
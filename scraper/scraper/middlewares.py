@@ -98,3 +98,17 @@ class ScraperDownloaderMiddleware:
 
     def spider_opened(self, spider):
         spider.logger.info("Spider opened: %s" % spider.name)
+
+
+class PlaywrightSlotMiddleware:
+    # Routes browser-rendered requests to their own "playwright" download
+    # slot (configured through DOWNLOAD_SLOTS) so they keep a low, fixed
+    # concurrency while plain HTTP requests use the domain slot. AutoThrottle
+    # is told to leave that slot's delay alone.
+
+    def process_request(self, request):
+        if request.meta.get("playwright"):
+            request.meta.setdefault("download_slot", "playwright")
+            request.meta.setdefault("autothrottle_dont_adjust_delay", True)
+        return None
+
@@ -7,7 +7,46 @@
 # useful for handling different item types with a single interface
 from itemadapter import ItemAdapter
 
+from scrapy.exceptions import NotConfigured
+
 
 class ScraperPipeline:
     def process_item(self, item, spider):
         return item
+
+
+class JsonLinesPipeline:
+    # Appends each item as one orjson-encoded line to JSONLINES_OUTPUT. The
+    # file is written through aiofiles, so the writes happen in a worker
+    # thread instead of blocking the reactor like the built-in feed exports.
+    # Disabled unless JSONLINES_OUTPUT is set.
+
+    def __init__(self, path):
+        # Imported only once the pipeline is enabled, so runs without
+        # JSONLINES_OUTPUT don't need aiofiles/orjson installed
+        import aiofiles
+        import orjson
+
+        self.path = path
+        self.file = None
+        self._open_file = aiofiles.open
+        self._dumps = orjson.dumps
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        path = crawler.settings.get("JSONLINES_OUTPUT")
+        if not path:
+            raise NotConfigured("JSONLINES_OUTPUT is not set")
+        return cls(path)
+
+    async def open_spider(self):
+        self.file = await self._open_file(self.path, "ab")
+
+    async def close_spider(self):
+        if self.file is not None:
+            await self.file.close()
+            self.file = None
+
+    async def process_item(self, item):
+        await self.file.write(self._dumps(ItemAdapter(item).asdict()) + b"\n")
+        return item
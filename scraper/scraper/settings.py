@@ -7,6 +7,8 @@
 #     https://docs.scrapy.org/en/latest/topics/downloader-middleware.html
 #     https://docs.scrapy.org/en/latest/topics/spider-middleware.html
 
+import os
+
 BOT_NAME = "scraper"
 
 SPIDER_MODULES = ["scraper.spiders"]
@@ -102,13 +104,24 @@ FEED_EXPORT_ENCODING = "utf-8"
 # Obey robots.txt
 ROBOTSTXT_OBEY = True
 
-# Configure delays for politeness
-DOWNLOAD_DELAY = 2
-CONCURRENT_REQUESTS_PER_DOMAIN = 2
+# Concurrency for plain HTTP requests; AutoThrottle backs off from here
+# based on observed latency. Playwright requests are limited separately
+# through the "playwright" download slot (see GsaSpider.custom_settings).
+CONCURRENT_REQUESTS = 64
+CONCURRENT_REQUESTS_PER_DOMAIN = 16
+DOWNLOAD_DELAY = 0
+DOWNLOAD_TIMEOUT = 30
+AUTOTHROTTLE_ENABLED = True
+AUTOTHROTTLE_TARGET_CONCURRENCY = 16
 
 # Identify your bot
 USER_AGENT = 'GSA-Scraper'
 
+# Level of the spider's own "gsa" logger only, so its per-request/per-row
+# DEBUG calls are skipped in normal runs; Scrapy and scrapy-playwright keep
+# following LOG_LEVEL. Use -s GSA_LOG_LEVEL=DEBUG to see them
+GSA_LOG_LEVEL = 'INFO'
+
 # Export settings
 FEEDS = {
     'results.json': {
@@ -122,6 +135,20 @@ FEEDS = {
     },
 }
 
+# Also stream items as JSON Lines to this file from the async
+# JsonLinesPipeline (aiofiles + orjson), e.g. -s JSONLINES_OUTPUT=items.jsonl
+#JSONLINES_OUTPUT = "items.jsonl"
+
+# Save the HTML of detail pages where no pricing table was found
+# (one debug_<hash>.html per URL, in DEBUG_DUMP_DIR or the system temp dir)
+DEBUG_DUMP_HTML = False
+#DEBUG_DUMP_DIR = "debug"
+
+# Render detail pages in the browser. Set to False to fetch them as plain
+# HTTP requests (with the search session's cookies), which is far cheaper
+# but only works while the pricing table is present in the served HTML.
+DETAIL_PAGES_PLAYWRIGHT = True
+
 # Playwright Configuration
 DOWNLOAD_HANDLERS = {
     "http": "scrapy_playwright.handler.ScrapyPlaywrightDownloadHandler",
@@ -138,4 +165,32 @@ PLAYWRIGHT_LAUNCH_OPTIONS = {
 #     "headless": False,
 #     # Optional: slow things down a bit so you can see interactions
 #     "slow_mo": 500,  # milliseconds between actions
-# }
\ No newline at end of file
+# }
+
+# Skip resources that are never scraped (images, fonts, CSS, analytics)
+# to cut bandwidth and render time. Scripts and XHR must still load so
+# Angular can render the results and pricing table.
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+BLOCKED_DOMAINS = (
+    "google-analytics",
+    "doubleclick",
+    "googletagmanager",
+    "dap.digitalgov.gov",  # Digital Analytics Program (federated analytics)
+    "en25.com",  # Eloqua tracking (img.en25.com)
+)
+
+
+def should_abort_request(request):
+    if request.resource_type in BLOCKED_RESOURCE_TYPES:
+        return True
+    return any(domain in request.url for domain in BLOCKED_DOMAINS)
+
+
+PLAYWRIGHT_ABORT_REQUEST = should_abort_request
+
+# Connect to an already running Chromium over CDP instead of launching a
+# fresh browser for every crawl (PLAYWRIGHT_LAUNCH_OPTIONS is then ignored).
+# Each crawl only opens and closes its own contexts on the shared browser:
+#   chromium --headless --remote-debugging-port=9222 --user-data-dir=/tmp/gsa-profile
+#   PLAYWRIGHT_CDP_URL=http://localhost:9222 scrapy crawl gsa
+PLAYWRIGHT_CDP_URL = os.environ.get("PLAYWRIGHT_CDP_URL")
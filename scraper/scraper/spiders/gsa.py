@@ -1,42 +1,423 @@
 import scrapy
+import asyncio
+import hashlib
 import json
+import os
 import re
-from urllib.parse import urljoin, urlparse, parse_qs, urlencode, urlunparse
+import string
+import tempfile
+from collections import Counter, defaultdict
+from urllib.parse import parse_qsl, quote, urlencode, urljoin, urlsplit, urlunsplit
+
+import lxml.html
+from lxml import etree
+from scrapy_playwright.page import PageMethod
+
+# Number of browser contexts search pages are spread across; each context
+# renders independently, so this is also the search-phase parallelism.
+SEARCH_CONTEXTS = 8
+
+# Playwright only frees per-request bookkeeping when a context is closed, so
+# each context is retired after serving this many pages to bound memory.
+CONTEXT_MAX_PAGES = 20
+
+# Browser contexts used in parallel per kind of page (default 1)
+CONTEXT_SLOTS = {'search': SEARCH_CONTEXTS}
+
+# Selectors and patterns are compiled once here rather than per call/row
+PRICING_ROWS_CSS = 'tr.selectedItem, tr.otherItem'
+PRODUCT_CARDS_CSS = 'app-ux-product-display-inline'
+CARD_PART_NUMBER_CSS = 'div.mfrPartNumber::text'
+CARD_DETAIL_LINK_CSS = 'div.itemName a::attr(href)'
+# Product cards whose Mfr Part Number equals $pn, upper-cased via translate()
+MATCHING_CARDS_XPATH = (
+    '//app-ux-product-display-inline['
+    'translate(normalize-space(.//div[contains(concat(" ", normalize-space(@class), " "), " mfrPartNumber ")]/text()),'
+    ' $lower, $upper) = $pn]'
+)
+
+PRICING_ROWS_XPATH = etree.XPath('//tr[contains(@class, "selectedItem") or contains(@class, "otherItem")]')
+LABEL_VALUE_XPATH = etree.XPath('.//div[contains(@class, "col-lg-8")]/text()')
+PRODUCT_NAME_XPATH = etree.XPath('//h1[contains(concat(" ", normalize-space(@class), " "), " product-title ")]//span/text()')
+# Pricing rows are split into their cells once; these run against one cell
+ROW_CELLS_XPATH = etree.XPath('./td')
+PRICE_XPATH = etree.XPath('.//strong/text()')
+UNIT_XPATH = etree.XPath('.//a[contains(@href, "UNIT_DEFINITIONS")]/text()')
+CONTRACTOR_BOLD_XPATH = etree.XPath('.//b/text()')
+CONTRACTOR_LINK_XPATH = etree.XPath('.//a[contains(@href, "contractor_detail")]')
+
+CONTRACT_NUMBER_RE = re.compile(r'contractNumber=([^&]+)')
+
+# How long cards may take to render after the search API call has finished
+# before a search is taken to have no hits
+SEARCH_RENDER_GRACE = 5
+
+
+def is_search_api_request(request):
+    """True for the XHR/fetch the results page loads its hits from."""
+    return (
+        request.resource_type in ('xhr', 'fetch')
+        and 'search' in urlsplit(request.url).path.lower()
+    )
+
+
+class SearchResultsWait:
+    """
+    Explicit "results are in" signal for one search page: resolves when a
+    product card is rendered, or when the search API call has finished and
+    no card has rendered within SEARCH_RENDER_GRACE seconds (zero-hit
+    searches end here).
+    
+    `start` is the request's playwright_page_init_callback, so the network
+    listener is attached before navigation and a fast response can't be
+    missed; `wait` runs as a PageMethod after the goto.
+    """
+    
+    def __init__(self, timeout=30, grace=SEARCH_RENDER_GRACE):
+        self.timeout = timeout
+        self.grace = grace
+        self._api_done = None
+        self._page = None
+        self._listeners = ()
+    
+    async def start(self, page, request):
+        # A retry after a failed goto calls start() again, often on the same page
+        self.stop()
+        api_done = self._api_done = asyncio.get_running_loop().create_future()
+        
+        def on_finished(pw_request):
+            if not api_done.done() and is_search_api_request(pw_request):
+                api_done.set_result(None)
+        
+        def on_failed(pw_request):
+            if not api_done.done() and is_search_api_request(pw_request):
+                api_done.set_exception(RuntimeError(f"Search API request failed: {pw_request.url}"))
+        
+        self._page = page
+        self._listeners = (('requestfinished', on_finished), ('requestfailed', on_failed))
+        for event, listener in self._listeners:
+            page.on(event, listener)
+    
+    def stop(self):
+        """Detach the network listeners added by start(), if any."""
+        if self._page is not None:
+            for event, listener in self._listeners:
+                self._page.remove_listener(event, listener)
+        self._page = None
+        self._listeners = ()
+    
+    async def wait(self, page):
+        card = asyncio.ensure_future(
+            page.wait_for_selector(PRODUCT_CARDS_CSS, timeout=self.timeout * 1000)
+        )
+        try:
+            done, _ = await asyncio.wait(
+                {card, self._api_done}, timeout=self.timeout, return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                raise TimeoutError(f"Search results did not load within {self.timeout}s")
+            if card not in done:
+                # Re-raises a failed search API call
+                self._api_done.result()
+                # The API call finishing is a network event and isn't ordered
+                # against Angular rendering the hits, so keep waiting for a card
+                done, _ = await asyncio.wait({card}, timeout=self.grace)
+            if card in done:
+                # Re-raises e.g. a closed page or the selector's own timeout
+                card.result()
+        finally:
+            self.stop()
+            if not card.done():
+                card.cancel()
+            # Retrieve the exception of a losing waiter so it isn't reported as unhandled
+            card.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
+def normalize_part_number(pn):
+    """Key part numbers are compared by: upper-cased, whitespace collapsed."""
+    return ' '.join(pn.upper().split())
+
+
+def classic_design_url(base_url, link):
+    """Resolve a detail link against `base_url` and force pdNewDesign=false unless already set."""
+    parts = urlsplit(urljoin(base_url, link))
+    # Kept as (key, value) pairs so repeated keys survive the round trip
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if not any(key == 'pdNewDesign' for key, _ in query):
+        query.append(('pdNewDesign', 'false'))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def first_text(values):
+    """Return the first XPath string result, stripped, or None."""
+    for value in values:
+        return value.strip()
+    return None
+
+
+def extract_labels(tree):
+    """
+    Map each detail-row label to its value in a single walk over <strong> tags,
+    e.g. {'Manufacturer': 'UNITED CHAIR COMPANY', ...}. The value is the text of
+    the col-lg-8 cell in the closest enclosing "row" div.
+    """
+    labels = {}
+    for strong in tree.iter('strong'):
+        label = strong.text_content().strip()
+        if not label or label in labels:
+            continue
+        for row in strong.iterancestors('div'):
+            if 'row' in (row.get('class') or '').split():
+                break
+        else:
+            continue
+        labels[label] = first_text(LABEL_VALUE_XPATH(row))
+    return labels
+
+
+def parse_detail(html, url, part_number, displayed_part_number, logger):
+    """
+    Extract price, vendor, and product details from a listing page's HTML.
+    Pure CPU work with no Scrapy/Playwright objects, so it can run off the
+    event loop. Returns (number of pricing rows found, list of items).
+    """
+    # Parse once with lxml and run every lookup against the same tree
+    tree = lxml.html.fromstring(html)
+    pricing_rows = PRICING_ROWS_XPATH(tree)
+    
+    # Manufacturer / part numbers come from the "<strong>Label</strong> | value" rows
+    labels = extract_labels(tree)
+    mfr_part_number = labels.get('Manufacturer Part Number')
+    contractor_part_number = labels.get('Contractor Part Number')
+    manufacturer = labels.get('Manufacturer')
+    
+    # Product name
+    product_name = first_text(PRODUCT_NAME_XPATH(tree))
+    
+    # Extract up to 10 prices from all pricing table rows
+    # Each row represents a different contractor/vendor offering
+    max_prices = 10
+    prices_extracted = 0
+    items = []
+    
+    for row in pricing_rows[:max_prices]:
+        # Price, unit and vendor live in the 2nd, 3rd and 5th <td>
+        cells = ROW_CELLS_XPATH(row)
+        if len(cells) < 2:
+            continue
+        price_cell = cells[1]
+        unit_cell = cells[2] if len(cells) > 2 else None
+        vendor_cell = cells[4] if len(cells) > 4 else None
+        
+        # Extract Price from 2nd <td> as <strong>$106.82</strong>
+        price_raw = first_text(PRICE_XPATH(price_cell))
+        price = None
+        if price_raw:
+            # Remove $ and clean up
+            price = price_raw.replace('$', '').strip()
+        
+        # Skip if no price found
+        if not price:
+            continue
+        
+        # Extract Unit of Measure from 3rd <td>
+        unit = first_text(UNIT_XPATH(unit_cell)) if unit_cell is not None else None
+        
+        # Extract Contractor/Vendor Name from 5th <td>
+        # selectedItem rows have contractor in <span><b>NAME</b></span>
+        # otherItem rows have contractor in <a href="contractor_detail">NAME</a>
+        contractor_name = None
+        contractor_url = None
+        if vendor_cell is not None:
+            # First try bold text (for selectedItem)
+            contractor_name = first_text(CONTRACTOR_BOLD_XPATH(vendor_cell))
+            contractor_links = CONTRACTOR_LINK_XPATH(vendor_cell)
+            if contractor_links:
+                # If not found, try contractor link (for otherItem)
+                if not contractor_name and contractor_links[0].text:
+                    contractor_name = contractor_links[0].text.strip()
+                contractor_url = contractor_links[0].get('href')
+        
+        # Extract Contract Number from contractor link URL in 5th <td>
+        contract_number = None
+        if contractor_url and 'contractNumber=' in contractor_url:
+            # Extract contract number from URL like: /advantage/ws/catalog/contractor_detail?contractNumber=GS-35F-402GA
+            match = CONTRACT_NUMBER_RE.search(contractor_url)
+            if match:
+                contract_number = match.group(1)
+        
+        # If we have a price, keep this pricing option
+        prices_extracted += 1
+        logger.info("Scraped price %d: %s - %s - $%s", prices_extracted, part_number, contractor_name, price)
+        
+        items.append({
+            'searched_part_number': part_number,
+            'displayed_part_number': displayed_part_number,
+            'mfr_part_number': mfr_part_number,
+            'contractor_part_number': contractor_part_number,
+            'manufacturer': manufacturer,
+            'price': price,
+            'unit': unit,
+            'contractor_name': contractor_name,
+            'contract_number': contract_number,
+            'product_name': product_name,
+            'url': url,
+        })
+    
+    if prices_extracted == 0:
+        logger.warning("No valid prices found for %s on page: %s", part_number, url)
+    
+    return len(pricing_rows), items
+
 
 class GsaSpider(scrapy.Spider):
     name = 'gsa'
     allowed_domains = ['gsaadvantage.gov']
     
     custom_settings = {
-        'CONCURRENT_REQUESTS_PER_DOMAIN': 2,  # Lower for browser automation
-        'DOWNLOAD_DELAY': 2,  # Longer delay for JavaScript pages
         'ROBOTSTXT_OBEY': True,
+        # Browser-rendered requests share their own downloader slot so the
+        # high plain-HTTP concurrency in settings.py doesn't apply to them
+        'DOWNLOAD_SLOTS': {
+            'playwright': {
+                'concurrency': SEARCH_CONTEXTS,  # One in-flight page per browser context
+                'delay': 0.5,  # Short stagger so the contexts actually overlap
+            },
+        },
+        'DOWNLOADER_MIDDLEWARES': {
+            'scraper.middlewares.PlaywrightSlotMiddleware': 542,
+        },
+        'DOWNLOAD_HANDLERS': {
+            'http': 'scraper.handlers.PlaywrightPageReuseHandler',
+            'https': 'scraper.handlers.PlaywrightPageReuseHandler',
+        },
+        # Only active when JSONLINES_OUTPUT is set
+        'ITEM_PIPELINES': {
+            'scraper.pipelines.JsonLinesPipeline': 300,
+        },
     }
     
+    @classmethod
+    def from_crawler(cls, crawler, *args, **kwargs):
+        spider = super().from_crawler(crawler, *args, **kwargs)
+        # Only the spider's logger; the rest of the project keeps LOG_LEVEL
+        spider.logger.logger.setLevel(crawler.settings.get('GSA_LOG_LEVEL', 'INFO'))
+        return spider
+    
     def __init__(self, part_numbers_file=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         
-        # Load part numbers from file
-        if part_numbers_file:
-            with open(part_numbers_file, 'r') as f:
-                self.part_numbers = [line.strip() for line in f if line.strip()]
-        else:
+        # Part numbers are read lazily from this file by _iter_part_numbers()
+        self.part_numbers_file = part_numbers_file
+        
+        # Pages handed out / finished per browser context, for context rotation
+        self._pages_assigned = Counter()
+        self._pages_released = Counter()
+        # Open pages waiting to be reused, by context name; handed out to new
+        # requests by PlaywrightPageReuseHandler
+        self.idle_pages = defaultdict(list)
+    
+    def next_context(self, kind):
+        """
+        Name the browser context for the next `kind` page. Pages go round-robin
+        over CONTEXT_SLOTS[kind] contexts, and every CONTEXT_MAX_PAGES pages per
+        slot a new generation of context names is started.
+        
+        Called by PlaywrightPageReuseHandler once the request has a free
+        download slot, so requests dropped by the dupefilter or still queued
+        for a slot are never counted.
+        """
+        slots = CONTEXT_SLOTS.get(kind, 1)
+        n = self._pages_assigned[kind]
+        self._pages_assigned[kind] += 1
+        return f"{kind}-{n % slots}-{n // (slots * CONTEXT_MAX_PAGES)}"
+    
+    async def _release_page(self, page, context_name, reuse=True):
+        """
+        Return a finished page to the idle pool of its context (or close it if
+        `reuse` is False), and close the whole context once it has served all
+        its pages.
+        """
+        self._pages_released[context_name] += 1
+        context = None
+        if page and not page.is_closed():
+            context = page.context
+            if reuse:
+                self.idle_pages[context_name].append(page)
+            else:
+                await page.close()
+        
+        if self._pages_released[context_name] >= CONTEXT_MAX_PAGES:
+            del self._pages_released[context_name]
+            idle = self.idle_pages.pop(context_name, [])
+            if context is None and idle:
+                context = idle[0].context
+            if context is not None:
+                self.logger.debug("Recycling browser context %s", context_name)
+                await context.close()
+    
+    async def _dump_debug_html(self, url, html):
+        """Save the first 50k chars of a page for debugging, one file per URL."""
+        dump_dir = self.settings.get('DEBUG_DUMP_DIR') or tempfile.gettempdir()
+        digest = hashlib.sha1(url.encode('utf-8')).hexdigest()[:8]
+        path = os.path.join(dump_dir, f"debug_{digest}.html")
+        
+        def write():
+            # A debug aid must never fail the callback, so errors are only logged
+            try:
+                os.makedirs(dump_dir, exist_ok=True)
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(html[:50000])
+            except OSError as e:
+                self.logger.warning("Could not save debug HTML for %s to %s: %s", url, path, e)
+                return False
+            return True
+        
+        # Keep the blocking file write off the event loop
+        if await asyncio.to_thread(write):
+            self.logger.info("Saved debug HTML for %s to %s", url, path)
+    
+    def _iter_part_numbers(self):
+        """
+        Yield each distinct part number once, streaming the file line by line
+        instead of loading it into a list up front.
+        """
+        if not self.part_numbers_file:
             # Default test with your example
-            self.part_numbers = ['BR32CCP07', 'UNCBR32CCP07']
+            yield from ['BR32CCP07', 'UNCBR32CCP07']
+            return
+        
+        seen = set()
+        with open(self.part_numbers_file, 'r') as f:
+            for line in f:
+                pn = line.strip()
+                # Dedupe on the same key results are matched by, so e.g.
+                # 'br32ccp07' and 'BR32CCP07' don't both search for one product
+                key = normalize_part_number(pn)
+                if not key or key in seen:
+                    continue
+                seen.add(key)
+                yield pn
     
     def start_requests(self):
         """
         Step 1: For each part number, go directly to the search-results URL.
         We let Scrapy-Playwright render the page and then parse the HTML.
+        Searches are spread round-robin over SEARCH_CONTEXTS browser contexts
+        on the shared browser so several part numbers render in parallel, and
+        each context is recycled after CONTEXT_MAX_PAGES searches.
         """
         base_url = "https://www.gsaadvantage.gov/advantage/ws/search/advantage_search"
         
-        for pn in self.part_numbers:
-            self.logger.info(f"Searching for: {pn}")
+        for pn in self._iter_part_numbers():
+            self.logger.info("Searching for: %s", pn)
             # URL pattern example from saved HTML (note the required leading '8'):
             # https://www.gsaadvantage.gov/advantage/ws/search/advantage_search?q=0:8859-BBFC&db=0&searchType=0
             search_term = f"8{pn}"
-            search_url = f"{base_url}?q=0:{search_term}&db=0&searchType=0"
+            # Quote the term so part numbers containing '#', '&', '+' or spaces
+            # don't corrupt the query string
+            search_url = f"{base_url}?q=0:{quote(search_term)}&db=0&searchType=0"
+            search_wait = SearchResultsWait()
             
             yield scrapy.Request(
                 search_url,
@@ -44,12 +425,17 @@ class GsaSpider(scrapy.Spider):
                 cb_kwargs={"part_number": pn},
                 meta={
                     "playwright": True,
-                    # We only need the rendered HTML for search results, not the page object
-                    "playwright_include_page": False,
+                    "context_kind": "search",
+                    # The page is only needed so its context can be recycled
+                    "playwright_include_page": True,
                     "playwright_page_goto_kwargs": {
-                        "wait_until": "networkidle",
+                        "wait_until": "domcontentloaded",
                         "timeout": 60000,
                     },
+                    "playwright_page_init_callback": search_wait.start,
+                    "playwright_page_methods": [
+                        PageMethod(search_wait.wait),
+                    ],
                 },
                 errback=self.errback_search_page,
                 dont_filter=True,
@@ -57,20 +443,38 @@ class GsaSpider(scrapy.Spider):
 
     async def errback_search_page(self, failure):
         """Handle errors on search page requests."""
-        page = failure.request.meta.get("playwright_page")
-        if page:
-            await page.close()
-        self.logger.error(f"Search page request failed: {failure.request.url} - {failure.value}")
+        meta = failure.request.meta
+        if meta.get("playwright_context"):
+            await self._release_page(meta.get("playwright_page"), meta["playwright_context"], reuse=False)
+        self.logger.error("Search page request failed: %s - %s", failure.request.url, failure.value)
 
     async def errback_detail_page(self, failure):
         """Handle errors on detail page requests"""
-        page = failure.request.meta.get("playwright_page")
-        if page:
-            await page.close()
-        self.logger.error(f"Detail page request failed: {failure.request.url} - {failure.value}")
+        meta = failure.request.meta
+        if meta.get("playwright_context"):
+            await self._release_page(meta.get("playwright_page"), meta["playwright_context"], reuse=False)
+        self.logger.error("Detail page request failed: %s - %s", failure.request.url, failure.value)
     
-    def parse_search_results(self, response, part_number=None):
+    async def parse_search_results(self, response, part_number=None):
         """Step 2: Extract listing links from search results - ONLY exact matches"""
+        page = response.meta.get("playwright_page")
+        
+        # Detail pages fetched over plain HTTP reuse the browser's session cookies
+        cookies = None
+        # The rendered HTML is already in the response; free the page for the
+        # next search, or close it if it failed us (it must be released either
+        # way, or its context is never recycled)
+        reuse = False
+        try:
+            if page and not self.settings.getbool('DETAIL_PAGES_PLAYWRIGHT', True):
+                cookies = [
+                    {key: cookie[key] for key in ('name', 'value', 'domain', 'path')}
+                    for cookie in await page.context.cookies()
+                ]
+            reuse = True
+        finally:
+            await self._release_page(page, response.meta["playwright_context"], reuse=reuse)
+        
         # Get part_number from parameter or response attribute
         if not part_number:
             part_number = getattr(response, '_part_number', None)
@@ -78,70 +482,65 @@ class GsaSpider(scrapy.Spider):
             self.logger.error("No part_number provided")
             return
         
-        # Find all product cards in search results
-        product_cards = response.css('app-ux-product-display-inline')
+        # EXACT MATCH CHECK (case-insensitive), evaluated inside libxml2 so only
+        # the matching cards come back instead of looping over every card
+        target = normalize_part_number(part_number)
+        matching_cards = response.xpath(
+            MATCHING_CARDS_XPATH,
+            pn=target,
+            lower=string.ascii_lowercase,
+            upper=string.ascii_uppercase,
+        )
         
-        if not product_cards:
-            self.logger.warning(f"No listings found for part number: {part_number}")
+        if not matching_cards and not response.css(PRODUCT_CARDS_CSS):
+            self.logger.warning("No listings found for part number: %s", part_number)
             return
         
         exact_matches = 0
         
-        # Check each product card
-        for card in product_cards:
-            # Extract the Mfr Part Number (the field right above product name)
-            displayed_part_number = card.css('div.mfrPartNumber::text').get()
+        for card in matching_cards:
+            exact_matches += 1
+            # The Mfr Part Number (the field right above product name)
+            displayed_part_number = card.css(CARD_PART_NUMBER_CSS).get().strip()
             
-            if displayed_part_number:
-                displayed_part_number = displayed_part_number.strip()
+            # Extract the link to detail page
+            detail_link = card.css(CARD_DETAIL_LINK_CSS).get()
+            
+            if detail_link:
+                # Absolute URL, requesting the classic design
+                full_url = classic_design_url(response.url, detail_link)
+                
+                self.logger.info("✓ Exact match found: %s for search %s", displayed_part_number, part_number)
+                self.logger.info("Requesting detail page (classic design): %s", full_url)
+                
+                meta = {
+                    'part_number': part_number,
+                    'displayed_part_number': displayed_part_number,
+                }
+                if cookies is None:
+                    meta.update({
+                        'playwright': True,
+                        'context_kind': 'detail',
+                        'playwright_include_page': True,
+                        'playwright_page_goto_kwargs': {
+                            # parse_listing waits for the pricing rows themselves
+                            'wait_until': 'domcontentloaded',
+                            'timeout': 60000,
+                        },
+                    })
                 
-                # EXACT MATCH CHECK (case-insensitive)
-                if displayed_part_number.upper() == part_number.upper():
-                    exact_matches += 1
-                    
-                    # Extract the link to detail page
-                    detail_link = card.css('div.itemName a::attr(href)').get()
-                    
-                    if detail_link:
-                        # Make sure we have an absolute URL
-                        if detail_link.startswith('/'):
-                            full_url = f"https://www.gsaadvantage.gov{detail_link}"
-                        elif detail_link.startswith('http'):
-                            full_url = detail_link
-                        else:
-                            full_url = urljoin(response.url, detail_link)
-                        
-                        # Ensure we're requesting classic design by adding pdNewDesign=false if not present
-                        if 'pdNewDesign' not in full_url:
-                            separator = '&' if '?' in full_url else '?'
-                            full_url = f"{full_url}{separator}pdNewDesign=false"
-                        
-                        self.logger.info(f"✓ Exact match found: {displayed_part_number} for search {part_number}")
-                        self.logger.info(f"Requesting detail page (classic design): {full_url}")
-                        
-                        yield scrapy.Request(
-                            full_url,
-                            callback=self.parse_listing,
-                            meta={
-                                'part_number': part_number,
-                                'displayed_part_number': displayed_part_number,
-                                'playwright': True,
-                                'playwright_include_page': True,
-                                'playwright_page_goto_kwargs': {
-                                    'wait_until': 'networkidle',
-                                    'timeout': 60000,
-                                },
-                            },
-                            errback=self.errback_detail_page,
-                            dont_filter=True,
-                        )
-                else:
-                    self.logger.debug(f"✗ Skipping non-match: {displayed_part_number} (searched for {part_number})")
+                yield scrapy.Request(
+                    full_url,
+                    callback=self.parse_listing,
+                    meta=meta,
+                    cookies=cookies,
+                    errback=self.errback_detail_page,
+                )
         
         if exact_matches == 0:
-            self.logger.warning(f"No exact matches found for: {part_number}")
+            self.logger.warning("No exact matches found for: %s", part_number)
         else:
-            self.logger.info(f"Found {exact_matches} exact match(es) for {part_number}")
+            self.logger.info("Found %d exact match(es) for %s", exact_matches, part_number)
     
     async def parse_listing(self, response):
         """Step 3: Extract price, vendor, and product details from listing page"""
@@ -150,143 +549,41 @@ class GsaSpider(scrapy.Spider):
         
         # Get Playwright page if available
         page = response.meta.get("playwright_page")
+        context_name = response.meta.get('playwright_context')
         
         if page:
-            # Prefer URL parameter approach for classic design (faster, less brittle)
+            # Detail URLs carry pdNewDesign=false, so the classic pricing table is
+            # rendered directly; just wait for it rather than switching designs.
             try:
-                # Wait for initial page load
-                await page.wait_for_load_state('networkidle', timeout=30000)
-                await page.wait_for_timeout(2000)  # Extra wait for Angular
-                
-                current_url = page.url
-                if 'pdNewDesign=false' not in current_url:
-                    # Add/force the classic design query parameter
-                    parsed = urlparse(current_url)
-                    query_params = parse_qs(parsed.query)
-                    query_params['pdNewDesign'] = ['false']
-                    new_query = urlencode(query_params, doseq=True)
-                    new_url = urlunparse((parsed.scheme, parsed.netloc, parsed.path, parsed.params, new_query, parsed.fragment))
-                    
-                    self.logger.info(f"Modifying URL to switch to classic design: {new_url}")
-                    await page.goto(new_url, wait_until='networkidle', timeout=60000)
-                    await page.wait_for_timeout(3000)  # Extra wait for classic design to render
-                
-                # Update response with (possibly) classic-design content
-                content = await page.content()
-                from scrapy.http import HtmlResponse
-                response = HtmlResponse(
-                    url=page.url,
-                    body=content.encode('utf-8'),
-                    encoding='utf-8'
-                )
+                await page.wait_for_selector(PRICING_ROWS_CSS, timeout=30000)
             except Exception as e:
-                self.logger.warning(f"Error switching to classic design (will try to parse anyway): {e}")
-        
-        # Debug: Check if table exists
-        table_rows = response.css('tr.selectedItem, tr.otherItem')
-        if not table_rows:
-            self.logger.warning(f"No pricing table rows found on page: {response.url}")
-            # Save HTML for debugging
-            with open('/Users/michael/Documents/Visions/scraper/debug_detail_page.html', 'w', encoding='utf-8') as f:
-                f.write(response.text[:50000])  # First 50k chars
-            self.logger.info("Saved debug HTML to debug_detail_page.html")
+                self.logger.warning("Pricing table did not render (will try to parse anyway): %s", e)
+            
+            # Released even if reading the page fails, so its context is still recycled
+            reuse = False
+            try:
+                html = await page.content()
+                url = page.url
+                reuse = True
+            finally:
+                await self._release_page(page, context_name, reuse=reuse)
         else:
-            self.logger.info(f"Found {len(table_rows)} pricing table rows")
-        
-        # Extract Manufacturer Part Number
-        mfr_part_number = None
-        mfr_part_rows = response.xpath('//div[contains(@class, "row") and .//strong[contains(text(), "Manufacturer Part Number")]]')
-        if mfr_part_rows:
-            mfr_part_number = mfr_part_rows.xpath('.//div[contains(@class, "col-lg-8")]/text()').get()
-            if mfr_part_number:
-                mfr_part_number = mfr_part_number.strip()
+            html = response.text
+            url = response.url
         
-        # Extract Contractor Part Number
-        contractor_part_number = None
-        contractor_part_rows = response.xpath('//div[contains(@class, "row") and .//strong[contains(text(), "Contractor Part Number")]]')
-        if contractor_part_rows:
-            contractor_part_number = contractor_part_rows.xpath('.//div[contains(@class, "col-lg-8")]/text()').get()
-            if contractor_part_number:
-                contractor_part_number = contractor_part_number.strip()
+        # Parsing is CPU-bound; run it in a worker thread so downloads and
+        # other callbacks keep going on the event loop meanwhile
+        row_count, items = await asyncio.to_thread(
+            parse_detail, html, url, part_number, displayed_part_number, self.logger,
+        )
         
-        # Extract Manufacturer
-        manufacturer = None
-        mfr_rows = response.xpath('//div[contains(@class, "row") and .//strong[text()="Manufacturer"]]')
-        if mfr_rows:
-            manufacturer = mfr_rows.xpath('.//div[contains(@class, "col-lg-8")]/text()').get()
-            if manufacturer:
-                manufacturer = manufacturer.strip()
-        
-        # Product name
-        product_name = response.css('h1.product-title span::text').get()
-        if product_name:
-            product_name = product_name.strip()
-        
-        # Extract up to 10 prices from all pricing table rows
-        # Each row represents a different contractor/vendor offering
-        pricing_rows = response.xpath('//tr[contains(@class, "selectedItem") or contains(@class, "otherItem")]')
-        max_prices = 10
-        prices_extracted = 0
-        
-        for row in pricing_rows[:max_prices]:
-            # Extract Price from 2nd <td> as <strong>$106.82</strong>
-            price_raw = row.xpath('.//td[2]//strong/text()').get()
-            price = None
-            if price_raw:
-                price_raw = price_raw.strip()
-                # Remove $ and clean up
-                price = price_raw.replace('$', '').strip()
-            
-            # Skip if no price found
-            if not price:
-                continue
-            
-            # Extract Unit of Measure from 3rd <td>
-            unit = None
-            unit_link = row.xpath('.//td[3]//a[contains(@href, "UNIT_DEFINITIONS")]/text()').get()
-            if unit_link:
-                unit = unit_link.strip()
-            
-            # Extract Contractor/Vendor Name from 5th <td>
-            # selectedItem rows have contractor in <span><b>NAME</b></span>
-            # otherItem rows have contractor in <a href="contractor_detail">NAME</a>
-            contractor_name = None
-            # First try bold text (for selectedItem)
-            contractor_bold = row.xpath('.//td[5]//b/text()').get()
-            if contractor_bold:
-                contractor_name = contractor_bold.strip()
-            # If not found, try contractor link (for otherItem)
-            if not contractor_name:
-                contractor_link = row.xpath('.//td[5]//a[contains(@href, "contractor_detail")]/text()').get()
-                if contractor_link:
-                    contractor_name = contractor_link.strip()
-            
-            # Extract Contract Number from contractor link URL in 5th <td>
-            contract_number = None
-            contractor_url = row.xpath('.//td[5]//a[contains(@href, "contractor_detail")]/@href').get()
-            if contractor_url and 'contractNumber=' in contractor_url:
-                # Extract contract number from URL like: /advantage/ws/catalog/contractor_detail?contractNumber=GS-35F-402GA
-                match = re.search(r'contractNumber=([^&]+)', contractor_url)
-                if match:
-                    contract_number = match.group(1)
-            
-            # If we have a price, yield this pricing option
-            prices_extracted += 1
-            self.logger.info(f"Scraped price {prices_extracted}: {part_number} - {contractor_name} - ${price}")
-            
-            yield {
-                'searched_part_number': part_number,
-                'displayed_part_number': displayed_part_number,
-                'mfr_part_number': mfr_part_number,
-                'contractor_part_number': contractor_part_number,
-                'manufacturer': manufacturer,
-                'price': price,
-                'unit': unit,
-                'contractor_name': contractor_name,
-                'contract_number': contract_number,
-                'product_name': product_name,
-                'url': response.url,
-            }
+        # Debug: Check if table exists
+        if not row_count:
+            self.logger.warning("No pricing table rows found on page: %s", url)
+            if self.settings.getbool('DEBUG_DUMP_HTML'):
+                await self._dump_debug_html(url, html)
+        else:
+            self.logger.info("Found %d pricing table rows", row_count)
         
-        if prices_extracted == 0:
-            self.logger.warning(f"No valid prices found for {part_number} on page: {response.url}")
\ No newline at end of file
+        for item in items:
+            yield item